@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 # coding: utf-8
 from astropy.coordinates import SkyCoord
-from astropy.table import QTable, unique, join
 from astropy.time import Time
 import astropy.units as u
 import jax
@@ -47,17 +46,10 @@ def propagate(reference, obstime):
 
 
 def update_reference(reference, observation):
-    unique_id = unique(observation, 'source_id')['source_id', ]
-    unique_id.meta = {}
-    reference = join(unique_id, reference, keys='source_id')
-
-    count = observation['source_id', ].copy()
-    count_by_id = count.group_by('source_id')
-    count_by_id = QTable([
-        count_by_id['source_id'].groups.aggregate(np.min),
-        count_by_id['source_id'].groups.aggregate(np.size),
-    ], names=[
-        'source_id',
-        'count',
-    ])
-    return join(reference, count_by_id, keys='source_id')
+    source_id, count = np.unique(observation['source_id'], return_counts=True)
+    reference = reference[np.isin(reference['source_id'], source_id)]
+    reference.sort('source_id')
+
+    idx = np.searchsorted(source_id, reference['source_id'])
+    reference['count'] = count[idx]
+    return reference
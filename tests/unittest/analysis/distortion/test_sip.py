@@ -11,6 +11,15 @@ def test_polymap(xy):
     polymap(coeff, xy)
 
 
+def test_polymap_expansion(random):
+    xy = jnp.array(random.uniform(-1, 1, size=(201, 2)))
+    x, y = xy[:, 0], xy[:, 1]
+    for k in range(2, 6):
+        coeff = jnp.array(random.normal(size=(k + 1)))
+        expected = sum(coeff[j] * x**(k - j) * y**j for j in range(k + 1))
+        assert polymap(coeff, xy) == approx(expected)
+
+
 def test_distortion(xy, random):
     coeff_a = random.normal(size=(18))
     coeff_b = random.normal(size=(18))
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from pytest import approx
+import jax.numpy as jnp
 
 from warpfield.analysis.projection.gnomonic import *
+from warpfield.analysis.projection.util import generate_conversion
 
 
 def test_gnomonic_conversion_zero():
@@ -25,6 +27,15 @@ def test_gnomonic_conversion_lat():
         assert X == approx(0.0)
 
 
+def test_gnomonic_conversion_components():
+    conversion = generate_conversion(gnomonic_Rsint, gnomonic_Rcost)
+    for lon, lat in [(0.1, 0.0), (0.0, 0.1), (0.05, -0.08)]:
+        X0, Y0 = conversion(0.1, -0.5, 0.1 + lon, -0.5 + lat)
+        X1, Y1 = gnomonic_conversion(0.1, -0.5, 0.1 + lon, -0.5 + lat)
+        assert X1 == approx(X0)
+        assert Y1 == approx(Y0)
+
+
 def test_gnomonic_rotate():
     def gnomonic_rotate(pa):
         a0 = 266.415  # Right Ascension of the Galactic Center
@@ -40,3 +51,21 @@ def test_gnomonic_rotate():
     X1, Y1 = gnomonic_rotate(180.0)
     assert X0 + X1 == approx(0.0)
     assert Y0 + Y1 == approx(0.0)
+
+
+def test_gnomonic_field_projection():
+    tel_ra = jnp.array([266.415, 266.515])
+    tel_dec = jnp.array([-29.006, -28.906])
+    tel_pa = jnp.array([0.0, 30.0])
+    ra = jnp.array([266.215, 266.415, 266.615])
+    dec = jnp.array([-29.206, -29.006, -28.806])
+    scale = jnp.ones((2, 2))
+
+    XY = field_projection(tel_ra, tel_dec, tel_pa, ra, dec, scale)
+    assert XY.shape == (2, 3, 2)
+
+    for n in range(2):
+        xy = projection(
+            jnp.repeat(tel_ra[n], 3), jnp.repeat(tel_dec[n], 3),
+            jnp.repeat(tel_pa[n], 3), ra, dec, jnp.ones((3, 2)))
+        assert XY[n].ravel() == approx(xy.ravel())
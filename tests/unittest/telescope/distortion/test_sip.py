@@ -29,3 +29,18 @@ def test_altsip_distortion_zero(seed=42, Nsrc=1000):
     func = DisplacedSipDistortion(order, center, A, B)
     converted = func(position)
     assert converted == approx(position)
+
+
+def test_sip_distortion_polynomial(seed=42, Nsrc=1000):
+    order = 2
+    A = np.ones((order + 1, order + 1)) * 1e-6
+    B = np.ones((order + 1, order + 1)) * 2e-6
+    np.random.seed(seed)
+    position = np.random.uniform(-1000, 1000, size=(2, Nsrc))
+
+    func = SipDistortion(order, A, B)
+    x, y = position
+    poly = 1 + x + y + x**2 + x * y + y**2
+    converted = func.apply(position)
+    assert converted[0] == approx(x + poly * 1e-6)
+    assert converted[1] == approx(y + poly * 2e-6)
@@ -83,3 +83,21 @@ def test_optics_imaging(optics, target):
 
     assert isinstance(table, FocalPlanePositionTable)
     assert len(table) == len(target)
+
+
+def test_optics_projection_same_frame(optics):
+    proj0 = optics.projection
+    proj1 = optics.get_projection('icrs')
+    assert proj1.wcs.crval == approx(proj0.wcs.crval)
+    assert proj1.wcs.cd.ravel() == approx(proj0.wcs.cd.ravel(), abs=1e-12)
+
+
+def test_optics_position_angle(optics):
+    origin = optics.pointing.galactic
+    north = optics.pointing.directional_offset_by(0.0, 1 * u.arcsec)
+    expected = optics.position_angle + origin.position_angle(north)
+
+    position_angle = optics.get_position_angle('galactic')
+    assert position_angle.unit == u.deg
+    assert position_angle.to_value('degree') \
+        == approx(expected.to_value('degree'), abs=1e-6)
@@ -88,6 +88,15 @@ def test_build_sourcetable_simple(source_simple):
     assert st.skycoord.dec.deg == approx([-0.1, 0.0, 0.1])
 
 
+def test_sourcetable_keeps_table(source_simple):
+    source_simple['ra'] = np.array([-0.1, +0.0, +0.1]) * u.degree
+    st = SourceTable(source_simple)
+    assert st.table['ra'].to_value('degree') == approx([-0.1, +0.0, +0.1])
+
+    st.table['dec'][0] = 0.5 * u.degree
+    assert st.skycoord.dec[0].deg == approx(-0.1)
+
+
 def test_io_sourcetable(source):
     st = SourceTable(source)
     with tempfile() as fp:
@@ -4,7 +4,7 @@ from pytest import approx, fixture
 from astropy.coordinates import SkyCoord
 import astropy.units as u
 
-from warpfield.telescope import Telescope
+from warpfield.telescope import Telescope, Detector
 
 from .test_optics import target
 
@@ -38,6 +38,29 @@ def test_telescope_observe(telescope, target):
     assert len(result) == len(target)
 
 
+def test_telescope_observe_stack(target):
+    pointing = SkyCoord(10.0 * u.degree, 30.0 * u.degree, frame='icrs')
+    detectors = [
+        Detector(1920, 1920, offset_dx=-9600 * u.um),
+        Detector(1920, 1920, offset_dx=+9600 * u.um),
+    ]
+    telescope = Telescope(pointing, 0.0 * u.degree, detectors=detectors)
+
+    tables = [d.table for d in telescope.observe(target)]
+    stacked = telescope.observe(target, stack=True).table
+    assert all(len(t) > 0 for t in tables)
+    assert len(stacked) == sum(len(t) for t in tables)
+
+    n = 0
+    for table in tables:
+        rows = stacked[n:n + len(table)]
+        assert list(rows['source_id']) == list(table['source_id'])
+        assert list(rows['detector_id']) == list(table['detector_id'])
+        assert rows['nx'].value == approx(table['nx'].value)
+        assert rows['ny'].value == approx(table['ny'].value)
+        n += len(table)
+
+
 def test_footprints(telescope):
     fp = telescope.get_footprints('icrs')
     assert len(fp) == 1  # number of detectors
@@ -61,3 +61,12 @@ def test_get_projection(target):
     proj = get_projection(target.galactic)
     assert proj.wcs.crval[0] == approx(target.galactic.l.deg)
     assert proj.wcs.crval[1] == approx(target.galactic.b.deg)
+
+
+def test_get_projection_cached(target):
+    proj = get_projection(target)
+    proj.wcs.crval = [0.0, 0.0]
+
+    proj = get_projection(target)
+    assert proj.wcs.crval[0] == approx(target.icrs.ra.deg)
+    assert proj.wcs.crval[1] == approx(target.icrs.dec.deg)
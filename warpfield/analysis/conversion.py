@@ -11,5 +11,5 @@ def degree_to_radian(theta):
 
 def rotation_matrix(theta):
     ''' Calculate rotation matrix R '''
-    rot = [jnp.cos(theta), -jnp.sin(theta), jnp.sin(theta), jnp.cos(theta)]
-    return jnp.array(rot).reshape([2, 2])
+    c, s = jnp.cos(theta), jnp.sin(theta)
+    return jnp.array([[c, -s], [s, c]])
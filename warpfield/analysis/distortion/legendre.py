@@ -145,8 +145,9 @@ distortion = jit(_distortion)
 if __name__ == '__main__':
     from timeit import timeit
 
+    rng = np.random.default_rng(seed=42)
     x = jnp.linspace(-1, 1, 201)
-    coeff = np.random.normal(size=(16))
+    coeff = rng.normal(size=(16))
 
     print('\nBenchmark of 1D-Legendre polynomial:\n')
     print('  w/o JIT compile:  {:.6f}'.format(
@@ -154,7 +155,7 @@ if __name__ == '__main__':
     print('  with JIT compile: {:.6f}'.format(
         timeit(lambda: legval(x, coeff), number=100) / 100))
 
-    coeff = np.random.normal(size=(8, 8))
+    coeff = rng.normal(size=(8, 8))
 
     print('\nBenchmark of 2D-Legendre polynomial:\n')
     print('  w/o JIT compile:  {:.6f}'.format(
@@ -173,7 +174,7 @@ if __name__ == '__main__':
     print('\nDistortion value shold be zero at the origin:\n')
     xy = jnp.array([[0.0, 0.0]])
     for n in range(10):
-        coeff_a = jnp.array(np.random.normal(size=(18)))
-        coeff_b = jnp.array(np.random.normal(size=(18)))
+        coeff_a = jnp.array(rng.normal(size=(18)))
+        coeff_b = jnp.array(rng.normal(size=(18)))
         print('  (case {0}): [{1:+.2e} {2:+.2e}]'.format(
             n, *distortion(coeff_a, coeff_b, xy)[0]))
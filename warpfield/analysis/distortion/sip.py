@@ -8,9 +8,17 @@ import jax.numpy as jnp
 import numpy as np
 
 
+# The k-th order terms (k = 2..5) are scaled by 10**(-4k).
+__sip_order__ = np.repeat(np.arange(2, 6), np.arange(3, 7))
+__sip_scale__ = 10.0**(-4 * __sip_order__)
+
+
 def _polymap(coeff, xy):
     ''' Calculate a two-dimensional polynomical expansion
 
+    The homogeneous polynomial p_0 x^k + p_1 x^(k-1) y + ... + p_k y^k is
+    evaluated by the Horner scheme without calculating any powers.
+
     Arguments:
       coeff: Coefficients of a polynomial expansion.
       xy: Original coordinates on the focal plane.
@@ -18,22 +26,25 @@ def _polymap(coeff, xy):
     Returns:
       A (N,2) list of converted coordinates.
     '''
+    x, y = xy[:, 0], xy[:, 1]
 
-    def inner(order, coeff):
+    def inner(carry, coeff):
         ''' Inner function to calculate a polynomical expansion
 
         Arguments:
-          order: A (m,n) integer power index pair.
+          carry: A pair of the partial sum and the power of y.
           coeff: A scale coefficient.
 
         Returns:
-          A list of calclated cordinates (p * x**m * y**n).
+          An updated pair of the partial sum and the power of y.
         '''
-        m, n = order
-        return [m - 1, n + 1], coeff * xy[:, 0]**m * xy[:, 1]**n
+        p, yn = carry
+        yn = yn * y
+        return [p * x + coeff * yn, yn], None
 
-    _, pq = scan(inner, [len(coeff) - 1, 0], coeff)
-    return pq.sum(axis=0)
+    init = [coeff[0] * jnp.ones_like(x), jnp.ones_like(y)]
+    (pq, _), _ = scan(inner, init, coeff[1:])
+    return pq
 
 
 polymap = jit(_polymap)
@@ -58,11 +69,8 @@ def _distortion(sip_a, sip_b, xy):
     Returns:
       Distorted coordinates on the focal plane.
     '''
-    scale = np.exp(
-        -np.log(10) * 4 *
-        np.array([2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5]))
-    sip_a *= scale
-    sip_b *= scale
+    sip_a *= __sip_scale__
+    sip_b *= __sip_scale__
     dx = polymap(sip_a[0:3], xy) + polymap(sip_a[3:7], xy) \
         + polymap(sip_a[7:12], xy) + polymap(sip_a[12:18], xy)
     dy = polymap(sip_b[0:3], xy) + polymap(sip_b[3:7], xy) \
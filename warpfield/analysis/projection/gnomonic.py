@@ -3,27 +3,75 @@
 ''' Gnomonic projection '''
 
 import jax.numpy as jnp
-from jax import vmap
+from jax import jit, vmap
 
-from .util import sptrig_cosr, generate_conversion, generate_projection
+from .util import generate_projection
+
+
+def _gnomonic_terms(tel_ra, tel_dec, ra, dec):
+    ''' Calculate the terms of the projected coordinates
+
+    The trigonometric functions shared by the x- and y-coordinates
+    are evaluated only once.
+
+    Arguments:
+      tel_ra: A right ascension of the telescope center in radian.
+      tel_dec: A declinatoin of the telescope center in radian.
+      ra: A right ascension of the target in radian.
+      dec: A declination of the target in radian.
+
+    Returns:
+      The numerators of the x- and y-coordinates and cos(r).
+    '''
+    sin_dec, cos_dec = jnp.sin(dec), jnp.cos(dec)
+    sin_tel, cos_tel = jnp.sin(tel_dec), jnp.cos(tel_dec)
+    sin_dra, cos_dra = jnp.sin(ra - tel_ra), jnp.cos(ra - tel_ra)
+    x = sin_dra * cos_dec
+    y = sin_dec * cos_tel - sin_tel * cos_dec * cos_dra
+    cosr = sin_tel * sin_dec + cos_tel * cos_dec * cos_dra
+    return x, y, cosr
 
 
 def gnomonic_Rsint(tel_ra, tel_dec, ra, dec):
     ''' Calculate the projected coordinate x '''
-    return jnp.sin(ra - tel_ra) * jnp.cos(dec) \
-        / sptrig_cosr(tel_ra, tel_dec, ra, dec)
+    x, _, cosr = _gnomonic_terms(tel_ra, tel_dec, ra, dec)
+    return x / cosr
 
 
 def gnomonic_Rcost(tel_ra, tel_dec, ra, dec):
     ''' Calculate the projected coordinate y '''
-    return (jnp.sin(dec) * jnp.cos(tel_dec)
-        - jnp.sin(tel_dec) * jnp.cos(dec) * jnp.cos(ra - tel_ra)) \
-        / sptrig_cosr(tel_ra, tel_dec, ra, dec)
+    _, y, cosr = _gnomonic_terms(tel_ra, tel_dec, ra, dec)
+    return y / cosr
+
+
+def _gnomonic_conversion(tel_ra, tel_dec, ra, dec):
+    ''' Calculate the projected coordinates (X, Y) in degree
+
+    This function is equivalent to
+    `generate_conversion(gnomonic_Rsint, gnomonic_Rcost)`, but the terms
+    shared by the x- and y-coordinates are evaluated only once.
+
+    Arguments:
+      tel_ra: A right ascension of the telescope center in radian.
+      tel_dec: A declinatoin of the telescope center in radian.
+      ra: A right ascension of the target in radian.
+      dec: A declination of the target in radian.
+
+    Returns:
+      Projected coordinates (X, Y) on the tangential plane in degree.
+    '''
+    x, y, cosr = _gnomonic_terms(tel_ra, tel_dec, ra, dec)
+
+    # The tangent-plane coordinates are (x/z, y/z) scaled into degree,
+    # where z = cos(r). Both axes share the same scale factor.
+    scale = (180.0 / jnp.pi) / cosr
+    return -x * scale, +y * scale
+
 
+gnomonic_conversion = jit(_gnomonic_conversion)
 
-gnomonic_conversion = \
-    generate_conversion(gnomonic_Rsint, gnomonic_Rcost)
+gnomonic = jit(generate_projection(_gnomonic_conversion))
 
-gnomonic = generate_projection(gnomonic_conversion)
+projection = jit(vmap(gnomonic, (0, 0, 0, 0, 0, 0), 0))
 
-projection = vmap(gnomonic, (0, 0, 0, 0, 0, 0), 0)
+field_projection = jit(vmap(gnomonic, (0, 0, 0, None, None, 0), 0))
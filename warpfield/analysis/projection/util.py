@@ -34,6 +34,10 @@ def generate_projection(func):
     def inner_func(tel_ra, tel_dec, tel_pa, ra, dec, scale):
         ''' Gnomonic projection of the spherical coordinates
 
+        The arguments `ra` and `dec` can be arrays of the targets observed
+        in a single pointing. The rotation matrix is calculated once per
+        pointing and applied to all the targets as a single product.
+
         Arguments:
           tel_ra: A right ascension of the telescope center in degree.
           tel_dec: A declinatoin of the telescope center in degree.
@@ -51,5 +55,6 @@ def generate_projection(func):
         ra = degree_to_radian(ra)
         dec = degree_to_radian(dec)
         X, Y = func(tel_ra, tel_dec, ra, dec)
-        return (rotation_matrix(-tel_pa) @ jnp.stack([X, Y])).T * scale
+        rot = rotation_matrix(-tel_pa)
+        return (rot @ jnp.stack([X, Y])).T * scale
     return inner_func
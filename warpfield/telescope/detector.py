@@ -187,6 +187,20 @@ class Detector:
         yf = self.within('y', position['ny'])
         return xf & yf
 
+    def locate(self, position):
+        ''' Locate the sources on the detector
+
+        Arguments:
+          position (FocalPlaneTable):
+              The positions of the sources on the focal plane.
+
+        Returns:
+          A tuple of the row indices of the sources on the detector and
+          a QTable of the (nx,ny)-coordinates of all the sources.
+        '''
+        xy = self.displacement(self.align(position.table))
+        return np.flatnonzero(self.contains(xy)), xy
+
     def capture(self, position):
         ''' Calculate the positions of the sources on the detector
 
@@ -200,9 +214,26 @@ class Detector:
           A `DetectorPositionTable`.
           The "nx" and "ny" columns are the positions on each detector.
         '''
-        table = position.table.copy()
-        xy = self.displacement(self.align(table))
-        table['nx'] = xy['nx']
-        table['ny'] = xy['ny']
-        within = self.contains(table)
-        return DetectorPositionTable(table[within])
+        return DetectorPositionTable(
+            collect_sources(position, [self.locate(position)]))
+
+
+def collect_sources(position, located):
+    ''' Collect the captured sources into a single table
+
+    Arguments:
+      position (FocalPlaneTable):
+          The positions of the sources on the focal plane.
+      located (list):
+          A list of the pairs returned by `Detector.locate`.
+
+    Returns:
+      A QTable of the captured sources, where the "nx" and "ny" columns are
+      the positions on the detectors. The rows are ordered by the pairs.
+    '''
+    # Only the sources on the detectors are copied into the output.
+    index = np.concatenate([within for within, _ in located])
+    table = position.table[index]
+    table['nx'] = np.concatenate([xy['nx'][within] for within, xy in located])
+    table['ny'] = np.concatenate([xy['ny'][within] for within, xy in located])
+    return table
@@ -4,6 +4,7 @@
 
 from dataclasses import dataclass
 from .base import BiPolynomialFunction, InvertibleFunction
+from numpy.polynomial.polynomial import polyval2d
 import numpy as np
 
 
@@ -36,26 +37,13 @@ class Sip(BiPolynomialFunction, InvertibleFunction):
         Returns:
           An ndarray instance contains modified coordinates.
         '''
-        N = position.shape[1]
         x, y = self.normalize(position)
 
-        dx = np.zeros_like(x)
-        tmp = np.zeros((self.order + 1, N))
-        for m in np.arange(self.order + 1):
-            n = self.order + 1 - m
-            tmp[m] = np.sum([self.A[m, i] * y**i for i in np.arange(n)],
-                            axis=0)
-        for m in np.arange(self.order + 1):
-            dx += tmp[m] * x**m
-
-        dy = np.zeros_like(x)
-        tmp = np.zeros((self.order + 1, N))
-        for m in np.arange(self.order + 1):
-            n = self.order + 1 - m
-            tmp[m] = np.sum([self.B[m, i] * y**i for i in np.arange(n)],
-                            axis=0)
-        for m in np.arange(self.order + 1):
-            dy += tmp[m] * x**m
+        # The terms with m + n > order are excluded in the SIP convention.
+        m, n = np.indices(self.A.shape)
+        triangle = (m + n) <= self.order
+        dx = polyval2d(x, y, np.where(triangle, self.A, 0.0))
+        dy = polyval2d(x, y, np.where(triangle, self.B, 0.0))
 
         return position + np.stack((dx, dy))
 
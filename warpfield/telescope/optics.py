@@ -4,11 +4,12 @@
 
 from dataclasses import dataclass
 from typing import Callable
-from astropy.coordinates import SkyCoord, Angle
+from astropy.coordinates import SkyCoord, Angle, BaseCoordinateFrame
+from astropy.coordinates import SphericalRepresentation
+from astropy.coordinates import UnitSphericalRepresentation
 from astropy.units.quantity import Quantity
 from shapely.geometry import Polygon, Point
-from shapely.geometry import MultiPoint
-from shapely.prepared import prep
+from shapely.predicates import contains_xy
 from shapely.measurement import minimum_bounding_radius
 from matplotlib.patches import Polygon as PolygonPatch
 import astropy.units as u
@@ -62,17 +63,65 @@ class Optics:
 
     def get_projection(self, frame):
         ''' Obtain the projection with a specific frame'''
-        reference = self.pointing.transform_to(frame)
-        position_angle = self.get_position_angle(frame)
+        reference, position_angle = self.__transform_pointing(frame)
         return get_projection(
             reference, self.scale.to_value(), position_angle)
 
     def get_position_angle(self, frame):
         ''' Obtain the position angle for a specific frame'''
-        origin = self.pointing.transform_to(frame)
-        original = self.pointing.directional_offset_by(0.0, 1 * u.arcsec)
-        delta = origin.position_angle(original)
-        return self.position_angle + delta
+        return self.__transform_pointing(frame)[1]
+
+    def __transform_pointing(self, frame):
+        ''' Transform the pointing and the position angle into a frame
+
+        Arguments:
+          frame: The coordinate frame to be transformed into.
+
+        Returns:
+          The pointing and the position angle in the specified frame.
+        '''
+        if isinstance(frame, BaseCoordinateFrame) \
+                and self.pointing.is_equivalent_frame(frame):
+            # No transformation is needed within the frame of the pointing.
+            reference, delta = self.pointing, 0.0
+        else:
+            reference, delta = self.__transform_north(frame)
+
+        delta = Angle(np.mod(delta, 2 * np.pi), unit=u.rad)
+        return reference, (self.position_angle + delta).to(u.deg)
+
+    def __transform_north(self, frame):
+        ''' Transform the pointing and its northward offset into a frame
+
+        Arguments:
+          frame: The coordinate frame to be transformed into.
+
+        Returns:
+          The pointing in the specified frame and the position angle of
+          the original north measured in the frame in radian.
+        '''
+        # The offset point toward the north shares the distance and the frame
+        # attributes of the pointing, so that the two points are transformed
+        # into the frame at once as a two-element array.
+        north = self.pointing.directional_offset_by(0.0, 1 * u.arcsec)
+        lon = u.Quantity([self.pointing.spherical.lon, north.spherical.lon])
+        lat = u.Quantity([self.pointing.spherical.lat, north.spherical.lat])
+        if isinstance(self.pointing.data, UnitSphericalRepresentation):
+            data = UnitSphericalRepresentation(lon, lat)
+        else:
+            distance = self.pointing.spherical.distance
+            data = SphericalRepresentation(
+                lon, lat, u.Quantity([distance, distance]))
+        offset = SkyCoord(data, frame=self.pointing).transform_to(frame)
+
+        # The position angle of the offset point measured at the pointing.
+        (lon0, lon1), (lat0, lat1) = \
+            offset.spherical.lon.rad, offset.spherical.lat.rad
+        delta = np.arctan2(
+            np.sin(lon1 - lon0) * np.cos(lat1),
+            np.cos(lat0) * np.sin(lat1)
+            - np.sin(lat0) * np.cos(lat1) * np.cos(lon1 - lon0))
+        return offset[0], delta
 
     def get_fov_patch(self, **options):
         ''' Get a patch of the field of view for Matplotlib '''
@@ -102,9 +151,9 @@ class Optics:
           A boolean array, where True if a source is located inside
           the field-of-view.
         '''
-        mp = MultiPoint(position.reshape((2, -1)).T)
-        polygon = prep(self.field_of_view.buffer(self.margin.to_value(u.um)))
-        return np.array([polygon.contains(p) for p in mp.geoms])
+        x, y = np.reshape(position, (2, -1))
+        polygon = self.field_of_view.buffer(self.margin.to_value(u.um))
+        return contains_xy(polygon, x, y)
 
     def imaging(self, sources, epoch=None):
         ''' Map celestial positions onto the focal plane
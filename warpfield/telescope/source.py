@@ -118,8 +118,11 @@ class SourceTable(QTableContainer):
           The `distance` column should be given as length.
         '''
         if self.has('parallax'):
-            parallax = np.clip(self.table['parallax'], 1e-6 * u.mas, np.inf)
-            return Distance(parallax=parallax)
+            # The inverse of parallax is calculated as a plain array,
+            # bypassing the parallax-to-distance unit conversion.
+            parallax = self.table['parallax'].to_value(u.mas)
+            parallax = np.clip(parallax, 1e-6, np.inf)
+            return Distance(1e3 / parallax, unit=u.pc, copy=False)
         elif self.has('distance'):
             assert self.get_dimension('distance') == 'length'
             return Distance(value=self.table['distance'])
@@ -266,4 +269,5 @@ def retrieve_gaia_sources(pointing, radius, snr_limit=10.0, row_limit=-1):
     if 'SOURCE_ID' in record.columns:
         record.rename_column('SOURCE_ID', 'source_id')
     record['non_single_star'] = record['non_single_star'] > 0
-    return SourceTable(QTable(record))
+    # The retrieved columns are wrapped without being duplicated.
+    return SourceTable(QTable(record, copy=False))
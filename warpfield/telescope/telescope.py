@@ -5,12 +5,11 @@
 from dataclasses import dataclass
 from typing import List
 from astropy.coordinates import SkyCoord, Angle
-from astropy.table import vstack
 import numpy as np
 
 from .source import DetectorPositionTable
 from .optics import Optics
-from .detector import Detector
+from .detector import Detector, collect_sources
 from .source import convert_skycoord_to_sourcetable
 from .util import estimate_frame_from_ctype
 
@@ -170,15 +169,20 @@ class Telescope:
           All tables are stacked into a single table if `stack` is True.
         '''
         fp_position = self.optics.imaging(source, epoch)
-        dets = []
-        for n, det in enumerate(self.detectors):
-            det_position = det.capture(fp_position)
-            if len(det_position) > 0:
-                det_position.table['detector_id'] = n
-            dets.append(det_position)
 
         if stack is False:
+            dets = []
+            for n, det in enumerate(self.detectors):
+                det_position = det.capture(fp_position)
+                if len(det_position) > 0:
+                    det_position.table['detector_id'] = n
+                dets.append(det_position)
             return dets
-        else:
-            stacked = vstack([d.table for d in dets])
-            return DetectorPositionTable(stacked)
+
+        # The stacked table is collected from the focal-plane table at once,
+        # instead of copying every detector table and aligning them.
+        located = [det.locate(fp_position) for det in self.detectors]
+        stacked = collect_sources(fp_position, located)
+        stacked['detector_id'] = np.concatenate([
+            np.full(within.size, n) for n, (within, _) in enumerate(located)])
+        return DetectorPositionTable(stacked)
@@ -3,7 +3,9 @@
 ''' miscellaneous tools
 '''
 
+from functools import lru_cache
 from astropy.wcs import WCS
+import astropy.units as u
 import numpy as np
 import sys
 
@@ -97,6 +99,23 @@ def get_projection(
     Returns:
       An object (astropy.wcs.WCS) for coordinate conversion.
     '''
+    lon = float(pointing.spherical.lon.deg)
+    lat = float(pointing.spherical.lat.deg)
+    galactic = pointing.frame.name == 'galactic'
+    rotation = float(u.Quantity(rotation, u.rad).value)
+
+    # The projection instances are cached by the scalar parameters.
+    # A copy is returned so that the cached instance is not modified.
+    proj = _build_projection(
+        lon, lat, galactic, float(scale), rotation,
+        left_hand_system, projection)
+    return proj.deepcopy()
+
+
+@lru_cache(maxsize=32)
+def _build_projection(
+        lon, lat, galactic, scale, rotation, left_hand_system, projection):
+    ''' Build the gnomonic projection instance from scalar parameters '''
 
     # This projection instance is used to map celestrical coordinates onto
     # a telescope focal plane. The conversion function `SkyCoord.to_pixel()`
@@ -107,9 +126,7 @@ def get_projection(
     # and `origin = 0` will fullfil the requirements.
     proj = WCS(naxis=2)
     proj.wcs.crpix = [1., 1.]
-    lon = pointing.spherical.lon.deg
-    lat = pointing.spherical.lat.deg
-    if pointing.frame.name == 'galactic':
+    if galactic:
         proj.wcs.ctype = [f'GLON-{projection}', f'GLAT-{projection}']
     else:
         proj.wcs.ctype = [f'RA---{projection}', f'DEC--{projection}']